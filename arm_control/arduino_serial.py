@@ -3,37 +3,69 @@
 import serial
 import time
 import threading
-from collections import deque
 from .servo_config import BAUD_RATE, PORT, clamp_angle, REST_POSITION
 
+# Servo name -> Arduino servo index (matches servo_pins[] in the sketch)
+SERVO_IDS = {'shoulder': 0, 'elbow': 1, 'wrist': 2, 'hand': 3}
+
+# Every possible command, precomputed: _COMMANDS[servo_id][angle] -> bytes
+# Format: 2-byte packet [0xF0 | servo_id, angle]
+# Example: b'\xf0\x5a' for shoulder at 90 degrees
+_COMMANDS = [[bytes((0xF0 | i, a)) for a in range(181)] for i in range(len(SERVO_IDS))]
+
 class ArduinoController:
-    """Handles serial communication with Arduino for servo control."""
+    """Handles serial communication with Arduino for servo control.
+    
+    Servo setters only record the latest target and return immediately;
+    a background sender thread batches pending targets into one serial
+    write, so a stalled USB link never blocks the caller.
+    """
     
-    def __init__(self, port=PORT, baud_rate=BAUD_RATE, timeout=1.0):
+    def __init__(self, port=PORT, baud_rate=BAUD_RATE, timeout=1.0, low_latency=True):
         """Initialize Arduino controller.
         
         Args:
             port: COM port (e.g., 'COM3', '/dev/ttyUSB0')
-            baud_rate: Serial baud rate (default 9600)
+            baud_rate: Serial baud rate (default 115200)
             timeout: Read timeout in seconds
+            low_latency: Request ASYNC_LOW_LATENCY on the port (Linux only)
         """
         self.port = port
         self.baud_rate = baud_rate
+        self.low_latency = low_latency
         self.serial = None
         self.connected = False
         self.current_angles = REST_POSITION.copy()
-        self.command_queue = deque()
         self.lock = threading.Lock()
         
+        # Latest-target slot: older setpoints are stale, so new ones overwrite them
+        self._pending = {}
+        # Last angle written per servo ID, to skip commands that change nothing
+        self._last_written = [-1] * len(SERVO_IDS)
+        # Serial writes that timed out and were requeued for retry (diagnostics)
+        self.write_timeouts = 0
+        self._tx_event = threading.Event()
+        self._tx_idle = threading.Event()
+        self._tx_idle.set()
+        self._tx_lock = threading.Lock()
+        self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+        
     def connect(self):
         """Establish serial connection to Arduino."""
         try:
             self.serial = serial.Serial(
                 port=self.port,
                 baudrate=self.baud_rate,
-                timeout=1.0
+                timeout=1.0,
+                write_timeout=0.01  # Never let a stalled USB link block the sender
             )
-            time.sleep(2)  # Wait for Arduino to reset
+            if not self._wait_for_ready():
+                print("Warning: no 'Arduino ready' banner received. The board may be "
+                      "running old firmware; upload ARDUINO_SKETCH if servos don't move.")
+            if self.low_latency:
+                self._enable_low_latency()
+            self._last_written = [-1] * len(SERVO_IDS)
             self.connected = True
             print(f"✓ Connected to Arduino on {self.port}")
             return True
@@ -41,40 +73,84 @@ class ArduinoController:
             print(f"✗ Failed to connect to {self.port}: {e}")
             return False
     
+    def _wait_for_ready(self, timeout=3.0):
+        """Wait for the sketch's "Arduino ready" banner after the board resets.
+        
+        Usually returns well under a second. Without a banner (e.g. other
+        firmware) it gives up after `timeout`, which still covers the ~2 s
+        bootloader delay.
+        
+        Returns:
+            True if the banner was seen
+        """
+        deadline = time.monotonic() + timeout
+        read_timeout = self.serial.timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                # Never let one readline() run past the deadline
+                self.serial.timeout = remaining
+                if b"Arduino ready" in self.serial.readline():
+                    return True
+        finally:
+            self.serial.timeout = read_timeout
+    
+    def _enable_low_latency(self):
+        """Drop the USB-serial latency timer to 1 ms where supported.
+        
+        Silently ignored on Windows/macOS and on drivers without
+        ASYNC_LOW_LATENCY support.
+        """
+        try:
+            self.serial.set_low_latency_mode(True)
+        except (AttributeError, IOError, ValueError, NotImplementedError):
+            pass
+    
     def disconnect(self):
         """Close serial connection."""
         if self.serial and self.serial.is_open:
-            self.serial.close()
+            self.flush()
+            with self._tx_lock:
+                self.serial.close()
             self.connected = False
             print("✓ Disconnected from Arduino")
     
     def set_servo(self, servo_name, angle):
-        """Send command to set servo angle.
+        """Queue a servo angle for the sender thread.
         
         Args:
             servo_name: 'shoulder', 'elbow', 'wrist', or 'hand'
             angle: Target angle (0-180 degrees)
         """
+        return self.set_servos_batch({servo_name: angle})
+    
+    def set_servos_batch(self, angle_dict):
+        """Queue several servo angles to be sent in a single serial write.
+        
+        Args:
+            angle_dict: {'servo_name': angle, ...}
+            
+        Raises:
+            KeyError: If a servo name is unknown
+        """
         if not self.connected:
             print("Warning: Arduino not connected")
             return False
         
-        angle = clamp_angle(angle, servo_name)
-        
-        with self.lock:
-            self.current_angles[servo_name] = angle
+        # Validate here so the caller gets the error, not the sender thread
+        for name in angle_dict:
+            SERVO_IDS[name]
         
-        # Format: S<servo_id>,<angle>\n
-        # Example: S0,90\n for shoulder at 90 degrees
-        servo_id = {'shoulder': 0, 'elbow': 1, 'wrist': 2, 'hand': 3}[servo_name]
-        command = f"S{servo_id},{int(angle)}\n"
+        clamped = {name: clamp_angle(angle, name) for name, angle in angle_dict.items()}
         
-        try:
-            self.serial.write(command.encode())
-            return True
-        except Exception as e:
-            print(f"Error sending command: {e}")
-            return False
+        with self.lock:
+            self.current_angles.update(clamped)
+            self._pending.update(clamped)
+            self._tx_idle.clear()
+        self._tx_event.set()
+        return True
     
     def set_multiple_servos(self, angle_dict):
         """Set multiple servos at once.
@@ -82,17 +158,95 @@ class ArduinoController:
         Args:
             angle_dict: {'servo_name': angle, ...}
         """
-        for servo_name, angle in angle_dict.items():
-            self.set_servo(servo_name, angle)
+        return self.set_servos_batch(angle_dict)
+    
+    def _tx_loop(self):
+        """Sender thread: write the latest pending angles whenever they change."""
+        while True:
+            self._tx_event.wait()
+            self._tx_event.clear()
+            
+            try:
+                self._send_pending()
+            except Exception as e:
+                # Never let one bad batch stop all further arm output
+                print(f"Error sending command: {e}")
+            
+            with self.lock:
+                if not self._pending:
+                    self._tx_idle.set()
+    
+    def _send_pending(self):
+        """Write pending angles whose integer value differs from the last write."""
+        with self.lock:
+            pending, self._pending = self._pending, {}
+        
+        # Only send servos whose integer angle actually changed
+        changed = {}
+        for name, angle in pending.items():
+            try:
+                angle = int(angle)
+                if angle != self._last_written[SERVO_IDS[name]]:
+                    changed[name] = angle
+            except (KeyError, ValueError, TypeError) as e:
+                print(f"Skipping invalid servo command {name!r}={angle!r}: {e}")
+        
+        if not changed:
+            return
+        
+        buf = b"".join(_COMMANDS[SERVO_IDS[n]][a] for n, a in changed.items())
+        with self._tx_lock:
+            try:
+                if self.serial is not None and self.serial.is_open:
+                    self.serial.write(buf)
+                    for n, a in changed.items():
+                        self._last_written[SERVO_IDS[n]] = a
+            except serial.SerialTimeoutException:
+                # Requeue the dropped angles unless a newer target has
+                # arrived meanwhile, so a still hand isn't left stale
+                self.write_timeouts += 1
+                with self.lock:
+                    for n, a in changed.items():
+                        self._pending.setdefault(n, a)
+                self._tx_event.set()
+            except Exception as e:
+                print(f"Error sending command: {e}")
+    
+    def flush(self, timeout=1.0):
+        """Block until queued servo commands have been written.
+        
+        The control loop never needs this; it is for one-off moves such
+        as tests and the final reset before disconnecting.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if everything queued was written, False if it was still
+            pending (e.g. dropped on a write timeout and awaiting retry)
+        """
+        self._tx_event.set()
+        return self._tx_idle.wait(timeout)
     
     def get_current_angles(self):
         """Get current servo angles."""
         with self.lock:
             return self.current_angles.copy()
     
+    def get_written_angles(self):
+        """Get the angles last actually written to the Arduino.
+        
+        Unlike get_current_angles(), this excludes commands still queued or
+        dropped on a write timeout. Servos never written report -1.
+        """
+        # Snapshot without _tx_lock so callers never wait on a serial write
+        written = list(self._last_written)
+        return {name: written[i] for name, i in SERVO_IDS.items()}
+    
     def reset_to_rest(self):
         """Move all servos to rest position."""
-        self.set_multiple_servos(REST_POSITION)
+        self.set_servos_batch(REST_POSITION)
+        self.flush()
 
 # Example Arduino sketch to upload to your board:
 ARDUINO_SKETCH = """
@@ -102,9 +256,10 @@ ARDUINO_SKETCH = """
 Servo servos[4];
 int servo_pins[4] = {2, 3, 4, 5};  // Pins for shoulder, elbow, wrist, hand
 int servo_angles[4] = {90, 90, 90, 0};  // Current angles
+int pending_servo = -1;  // Servo ID awaiting its angle byte
 
 void setup() {
-  Serial.begin(9600);
+  Serial.begin(115200);
   
   // Attach servos to pins
   for (int i = 0; i < 4; i++) {
@@ -112,25 +267,25 @@ void setup() {
     servos[i].write(servo_angles[i]);
   }
   
+  // Required: the host waits for this exact banner before sending commands
   Serial.println("Arduino ready");
 }
 
 void loop() {
-  // Check for incoming serial commands
-  if (Serial.available() > 0) {
-    String command = Serial.readStringUntil('\\n');
-    command.trim();
+  // Commands are 2-byte packets: [0xF0 | servo_id, angle]
+  // Header bytes are >= 0xF0 and angles are 0-180 (< 0xF0), so a
+  // header byte always starts a new packet, even after a dropped byte.
+  while (Serial.available() > 0) {
+    int b = Serial.read();
     
-    // Parse command format: S<servo_id>,<angle>
-    if (command.startsWith("S")) {
-      int comma_pos = command.indexOf(',');
-      int servo_id = command.substring(1, comma_pos).toInt();
-      int angle = command.substring(comma_pos + 1).toInt();
-      
-      if (servo_id >= 0 && servo_id < 4 && angle >= 0 && angle <= 180) {
-        servos[servo_id].write(angle);
-        servo_angles[servo_id] = angle;
+    if (b >= 0xF0) {
+      pending_servo = b & 0x0F;
+    } else if (pending_servo >= 0) {
+      if (pending_servo < 4 && b <= 180) {
+        servos[pending_servo].write(b);
+        servo_angles[pending_servo] = b;
       }
+      pending_servo = -1;
     }
   }
 }
@@ -1,5 +1,7 @@
 """Servo configuration and angle mappings for prosthetic arm."""
 
+import numpy as np
+
 # Arduino pin assignments (adjust based on your wiring)
 SERVO_PINS = {
     'shoulder': 2,      # Shoulder rotation (0-180°)
@@ -8,6 +10,9 @@ SERVO_PINS = {
     'hand': 5,          # Hand open/close (0-180°)
 }
 
+# Fixed servo order for vectorized angle state (matches Arduino servo IDs)
+SERVO_ORDER = ('shoulder', 'elbow', 'wrist', 'hand')
+
 # Min/max angles for each servo to prevent damage
 SERVO_LIMITS = {
     'shoulder': (0, 180),
@@ -24,13 +29,28 @@ REST_POSITION = {
     'hand': 0,          # Open
 }
 
+# Rest position as a vector in SERVO_ORDER (read-only; copy before modifying)
+REST_VEC = np.array([REST_POSITION[s] for s in SERVO_ORDER], dtype=np.float32)
+REST_VEC.flags.writeable = False
+
 # Smoothing factor (0.0-1.0) for servo movement
 SMOOTHING_FACTOR = 0.3
 
 # Serial communication
-BAUD_RATE = 9600
+# Must match Serial.begin() in ARDUINO_SKETCH. ATmega328 and SAMD boards also
+# handle 250000 and 500000. On FTDI USB-serial adapters the 16 ms latency
+# timer dominates at any baud rate, so this only pays off together with
+# low-latency mode (see below).
+BAUD_RATE = 115200
 PORT = 'COM3'  # Change to your Arduino port (COM3, COM4, /dev/ttyUSB0, etc.)
 
+# ArduinoController enables low-latency mode on connect, which drops the
+# FTDI latency timer from 16 ms to 1 ms. On Linux this needs CAP_SYS_ADMIN;
+# without it, set the timer directly instead:
+#   echo 1 > /sys/bus/usb-serial/devices/ttyUSB0/latency_timer
+# or persist it with a udev rule:
+#   ACTION=="add", SUBSYSTEM=="usb-serial", DRIVER=="ftdi_sio", ATTR{latency_timer}="1"
+
 def clamp_angle(angle, servo_name):
     """Clamp angle to servo limits."""
     min_angle, max_angle = SERVO_LIMITS.get(servo_name, (0, 180))
@@ -1,6 +1,7 @@
 """Main demo: Camera-based gesture control of prosthetic arm."""
 
 import cv2
+import numpy as np
 import sys
 from pathlib import Path
 
@@ -8,33 +9,43 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from arm_control import ArduinoController
-from arm_control.servo_config import PORT, SMOOTHING_FACTOR, REST_POSITION
+from arm_control.servo_config import PORT, BAUD_RATE, SMOOTHING_FACTOR, SERVO_ORDER, REST_VEC
 from vision.gesture_recognition import GestureRecognizer
 from vision.pose_mapper import PoseMapper
+from vision.frame_grabber import FrameGrabber
+
+# cv2.pollKey() (OpenCV >= 4.5) returns immediately; waitKey(1) can block 5-15 ms
+_poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
+
+# Frames between blocking waitKey(1) calls that keep the GUI responsive
+KEY_WAIT_INTERVAL = 10
 
 
 class ArmGestureController:
     """Orchestrates camera input, gesture recognition, and arm control."""
     
-    def __init__(self, com_port=PORT, camera_id=0):
+    def __init__(self, com_port=PORT, camera_id=0, baud_rate=BAUD_RATE, min_delta=1.0):
         """Initialize gesture arm controller.
         
         Args:
             com_port: Arduino COM port (e.g., 'COM3')
             camera_id: Camera index (0 for default)
+            baud_rate: Serial baud rate, must match Serial.begin() in the sketch
+            min_delta: Minimum angle change (degrees) before a servo is resent
         """
         self.com_port = com_port
         self.camera_id = camera_id
         
         # Initialize components
-        self.arduino = ArduinoController(port=com_port)
+        self.arduino = ArduinoController(port=com_port, baud_rate=baud_rate)
         self.gesture_recognizer = GestureRecognizer()
         self.pose_mapper = PoseMapper()
         
-        # State tracking
-        self.current_angles = REST_POSITION.copy()
-        self.target_angles = REST_POSITION.copy()
+        # State tracking: one angle per servo, indexed by SERVO_ORDER
+        self.current_angles = REST_VEC.copy()
+        self.target_angles = REST_VEC.copy()
         self.smoothing_factor = SMOOTHING_FACTOR
+        self.min_delta = min_delta
         self.running = False
         
     def connect_arduino(self) -> bool:
@@ -54,7 +65,7 @@ class ArmGestureController:
             frame: Input video frame (BGR)
             
         Returns:
-            (processed_frame, angles_dict)
+            (processed_frame, target_angles) with angles in SERVO_ORDER
         """
         # Detect hand landmarks
         hand_data = self.gesture_recognizer.detect_hand(frame)
@@ -69,10 +80,8 @@ class ArmGestureController:
             
             # Smooth angles for less jittery movement
             if new_angles:
-                for servo, angle in new_angles.items():
-                    current = self.target_angles.get(servo, 90)
-                    smooth_angle = current + self.smoothing_factor * (angle - current)
-                    self.target_angles[servo] = smooth_angle
+                new_vec = np.array([new_angles[s] for s in SERVO_ORDER], dtype=np.float32)
+                self.target_angles += self.smoothing_factor * (new_vec - self.target_angles)
         
         return frame, self.target_angles
     
@@ -82,11 +91,20 @@ class ArmGestureController:
             return
         
         # Interpolate current → target
-        for servo, target in self.target_angles.items():
-            current = self.current_angles.get(servo, 90)
-            smooth = current + self.smoothing_factor * (target - current)
-            self.current_angles[servo] = smooth
-            self.arduino.set_servo(servo, smooth)
+        self.current_angles += self.smoothing_factor * (self.target_angles - self.current_angles)
+        
+        # Suppress sub-threshold jitter from the smoother, measured against
+        # what actually reached the Arduino so dropped writes get resent
+        written = self.arduino.get_written_angles()
+        written_vec = np.array([written[s] for s in SERVO_ORDER], dtype=np.float32)
+        changed = np.abs(self.current_angles - written_vec) >= self.min_delta
+        if not changed.any():
+            return
+        
+        # Non-blocking: the Arduino sender thread does the serial write
+        self.arduino.set_servos_batch({
+            SERVO_ORDER[i]: float(self.current_angles[i]) for i in np.flatnonzero(changed)
+        })
     
     def run(self):
         """Main control loop: camera → gesture → arm."""
@@ -100,8 +118,16 @@ class ArmGestureController:
             print(f"❌ Failed to open camera {self.camera_id}")
             return False
         
+        # MJPG must be requested before the resolution: uncompressed YUY2
+        # is USB-bandwidth capped to 5-10 FPS at 720p on most webcams
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        # Keep only the newest frame so cap.read() never returns a stale one
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        # Capture on a background thread so grabbing overlaps processing
+        grabber = FrameGrabber(cap).start()
         
         self.running = True
         print("\n✓ Ready! Controls:")
@@ -110,9 +136,10 @@ class ArmGestureController:
         print("  • Press 'Q' to quit")
         print("\n" + "="*50 + "\n")
         
+        frame_count = 0
         try:
             while self.running:
-                ret, frame = cap.read()
+                ret, frame = grabber.read()
                 if not ret:
                     break
                 
@@ -132,20 +159,28 @@ class ArmGestureController:
                 cv2.imshow('Prosthetic Arm Gesture Control', frame)
                 
                 # Handle keyboard
-                key = cv2.waitKey(1) & 0xFF
+                frame_count += 1
+                if frame_count % KEY_WAIT_INTERVAL == 0:
+                    key = cv2.waitKey(1) & 0xFF
+                else:
+                    key = _poll_key() & 0xFF
                 if key == ord('q'):
                     print("\nQuitting...")
                     break
                 elif key == ord('r'):
                     print("Resetting to rest position...")
-                    self.target_angles = REST_POSITION.copy()
-                    self.current_angles = REST_POSITION.copy()
+                    np.copyto(self.target_angles, REST_VEC)
+                    np.copyto(self.current_angles, REST_VEC)
                     self.arduino.reset_to_rest()
         
         except KeyboardInterrupt:
             print("\nInterrupted by user")
         finally:
-            cap.release()
+            # Releasing while the grabber is still inside cap.read() is unsafe
+            if grabber.stop():
+                cap.release()
+            else:
+                print("Warning: camera thread did not stop; leaving capture open")
             cv2.destroyAllWindows()
             self.gesture_recognizer.release()
             if self.arduino.connected:
@@ -158,7 +193,7 @@ class ArmGestureController:
     def _draw_angles_on_frame(self, frame):
         """Draw current servo angles on frame."""
         y_offset = 30
-        for servo, angle in self.current_angles.items():
+        for servo, angle in zip(SERVO_ORDER, self.current_angles):
             text = f"{servo.capitalize()}: {angle:.1f}°"
             cv2.putText(frame, text, (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX,
                        0.6, (0, 255, 0), 2)
@@ -172,6 +207,7 @@ def main():
     parser = argparse.ArgumentParser(description='Gesture-controlled prosthetic arm')
     parser.add_argument('--port', default=PORT, help=f'Arduino COM port (default: {PORT})')
     parser.add_argument('--camera', type=int, default=0, help='Camera index (default: 0)')
+    parser.add_argument('--baud', type=int, default=BAUD_RATE, help=f'Serial baud rate (default: {BAUD_RATE})')
     parser.add_argument('--dry-run', action='store_true', help='Run without Arduino')
     
     args = parser.parse_args()
@@ -180,7 +216,7 @@ def main():
     print("║   Prosthetic Arm Gesture Control       ║")
     print("╚════════════════════════════════════════╝")
     
-    controller = ArmGestureController(com_port=args.port, camera_id=args.camera)
+    controller = ArmGestureController(com_port=args.port, camera_id=args.camera, baud_rate=args.baud)
     
     if args.dry_run:
         print("Running in dry-run mode (no Arduino)")
@@ -47,6 +47,7 @@ def main():
             for angle in [0, 45, 90, 135, 180]:
                 print(f"    → {angle}°", end='', flush=True)
                 controller.set_servo(servo, angle)
+                controller.flush()
                 time.sleep(0.3)
             print()
         
@@ -1,5 +1,14 @@
 """Computer vision module for gesture recognition."""
-from .gesture_recognition import GestureRecognizer
 from .pose_mapper import PoseMapper
+from .frame_grabber import FrameGrabber
 
-__all__ = ['GestureRecognizer', 'PoseMapper']
+__all__ = ['GestureRecognizer', 'PoseMapper', 'FrameGrabber']
+
+
+def __getattr__(name):
+    # Loaded on first use so importing the numpy-only modules doesn't pull in
+    # cv2 and mediapipe
+    if name == 'GestureRecognizer':
+        from .gesture_recognition import GestureRecognizer
+        return GestureRecognizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,84 @@
+"""Background camera capture."""
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class FrameGrabber:
+    """Continuously read frames from a capture device on a background thread.
+    
+    Only the newest frame is kept (older frames are stale), so the consumer
+    always processes the freshest image and USB transfer overlaps with
+    processing instead of running in series with it.
+    """
+    
+    def __init__(self, cap):
+        """Initialize frame grabber.
+        
+        Args:
+            cap: Opened cv2.VideoCapture
+        """
+        self.cap = cap
+        self.running = False
+        self._frame = None
+        self._frame_id = 0
+        self._last_read_id = 0
+        self._cond = threading.Condition()
+        self._thread = None
+    
+    def start(self):
+        """Start the capture thread."""
+        self.running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        return self
+    
+    def _capture_loop(self):
+        """Grab frames until stopped or the camera fails."""
+        while self.running:
+            ret, frame = self.cap.read()
+            with self._cond:
+                if not ret:
+                    self.running = False
+                else:
+                    self._frame = frame
+                    self._frame_id += 1
+                self._cond.notify_all()
+    
+    def read(self, timeout: float = 2.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """Return the newest frame not yet returned, waiting for one if needed.
+        
+        Args:
+            timeout: Maximum time to wait for a new frame in seconds
+            
+        Returns:
+            (success, frame) like cv2.VideoCapture.read()
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._frame_id != self._last_read_id or not self.running,
+                timeout
+            )
+            if self._frame_id == self._last_read_id:
+                return False, None
+            self._last_read_id = self._frame_id
+            return True, self._frame
+    
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop the capture thread.
+        
+        Args:
+            timeout: Maximum time to wait for the thread to exit in seconds
+            
+        Returns:
+            True if the thread has exited, so the capture is safe to release
+        """
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+            self._thread = None
+        return True
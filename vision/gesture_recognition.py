@@ -5,11 +5,30 @@ import mediapipe as mp
 import numpy as np
 from typing import Dict, Tuple, List, Optional
 
+from .landmarks import FINGERTIP_IDX
+
+# Landmark chains from the wrist out to each finger tip, used for drawing
+FINGER_CHAINS = [
+    np.array([0, 1, 2, 3, 4]),       # Thumb
+    np.array([0, 5, 6, 7, 8]),       # Index
+    np.array([0, 9, 10, 11, 12]),    # Middle
+    np.array([0, 13, 14, 15, 16]),   # Ring
+    np.array([0, 17, 18, 19, 20]),   # Pinky
+]
+
 class GestureRecognizer:
     """Recognize hand pose and extract keypoints using MediaPipe."""
     
-    def __init__(self):
-        """Initialize MediaPipe hand detector."""
+    def __init__(self, inference_size: Optional[Tuple[int, int]] = (640, 360)):
+        """Initialize MediaPipe hand detector.
+        
+        Args:
+            inference_size: (width, height) box frames are downscaled to fit
+                inside before detection, keeping their aspect ratio, or None
+                to run on the full frame. Smaller is faster; landmarks are
+                normalized so drawing is unaffected.
+        """
+        self.inference_size = inference_size
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.hands = self.mp_hands.Hands(
@@ -18,6 +37,9 @@ class GestureRecognizer:
             min_detection_confidence=0.7,
             min_tracking_confidence=0.5
         )
+        # Persistent buffers reused across frames (allocated on first use)
+        self._small_buf = None
+        self._rgb_buf = None
     
     def detect_hand(self, frame) -> Optional[Dict]:
         """Detect hand landmarks in frame.
@@ -26,23 +48,30 @@ class GestureRecognizer:
             frame: Input video frame (BGR)
             
         Returns:
-            Dictionary with hand keypoints or None if no hand detected
+            Dictionary with hand keypoints or None if no hand detected.
+            'keypoints' is a (21, 4) float32 array of normalized
+            (x, y, z, visibility) rows, one per landmark.
         """
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
+        frame = self._downscale(frame)
+        
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # Read-only input lets MediaPipe skip its defensive copy
+        self._rgb_buf.flags.writeable = False
+        results = self.hands.process(self._rgb_buf)
         
         if results.multi_hand_landmarks:
             hand_landmarks = results.multi_hand_landmarks[0]
             
             # Extract keypoints as normalized coordinates (0-1)
-            keypoints = []
-            for landmark in hand_landmarks.landmark:
-                keypoints.append({
-                    'x': landmark.x,
-                    'y': landmark.y,
-                    'z': landmark.z,
-                    'visibility': landmark.visibility
-                })
+            keypoints = np.fromiter(
+                (v for lm in hand_landmarks.landmark
+                 for v in (lm.x, lm.y, lm.z, lm.visibility)),
+                dtype=np.float32, count=84
+            ).reshape(21, 4)
             
             return {
                 'keypoints': keypoints,
@@ -52,6 +81,26 @@ class GestureRecognizer:
         
         return None
     
+    def _downscale(self, frame):
+        """Shrink frame to fit inside inference_size, preserving aspect ratio.
+        
+        Frames already that small are returned unchanged.
+        """
+        if self.inference_size is None:
+            return frame
+        
+        frame_h, frame_w = frame.shape[:2]
+        scale = min(self.inference_size[0] / frame_w, self.inference_size[1] / frame_h)
+        if scale >= 1.0:
+            return frame
+        
+        size = (max(1, round(frame_w * scale)), max(1, round(frame_h * scale)))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        if self._small_buf is None or self._small_buf.shape != shape:
+            self._small_buf = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        return self._small_buf
+    
     def draw_hand(self, frame, hand_data) -> None:
         """Draw hand landmarks on frame.
         
@@ -62,33 +111,20 @@ class GestureRecognizer:
         if hand_data is None:
             return
         
-        # Create dummy hand landmarks object for drawing
         keypoints = hand_data['keypoints']
         frame_h, frame_w = frame.shape[:2]
         
+        # Convert all keypoints to pixel coordinates in one pass
+        pts = (keypoints[:, :2] * np.array([frame_w, frame_h], dtype=np.float32)).astype(np.int32)
+        
+        # Draw connections (wrist to each finger tip) as one polyline per finger
+        cv2.polylines(frame, [pts[chain] for chain in FINGER_CHAINS], False, (0, 255, 0), 2)
+        
         # Draw circles at keypoints
-        for i, kp in enumerate(keypoints):
-            x = int(kp['x'] * frame_w)
-            y = int(kp['y'] * frame_h)
-            cv2.circle(frame, (x, y), 3, (0, 255, 0), -1)
-        
-        # Draw connections (wrist to fingers)
-        connections = [
-            (0, 1), (1, 2), (2, 3), (3, 4),      # Thumb
-            (0, 5), (5, 6), (6, 7), (7, 8),      # Index
-            (0, 9), (9, 10), (10, 11), (11, 12), # Middle
-            (0, 13), (13, 14), (14, 15), (15, 16), # Ring
-            (0, 17), (17, 18), (18, 19), (19, 20)  # Pinky
-        ]
-        
-        for start, end in connections:
-            start_kp = keypoints[start]
-            end_kp = keypoints[end]
-            start_pos = (int(start_kp['x'] * frame_w), int(start_kp['y'] * frame_h))
-            end_pos = (int(end_kp['x'] * frame_w), int(end_kp['y'] * frame_h))
-            cv2.line(frame, start_pos, end_pos, (0, 255, 0), 2)
+        for x, y in pts:
+            cv2.circle(frame, (int(x), int(y)), 3, (0, 255, 0), -1)
     
-    def get_hand_center(self, hand_data) -> Optional[Tuple[float, float]]:
+    def get_hand_center(self, hand_data) -> Optional[np.ndarray]:
         """Get center of hand (wrist position).
         
         Args:
@@ -100,29 +136,21 @@ class GestureRecognizer:
         if hand_data is None:
             return None
         
-        wrist = hand_data['keypoints'][0]
-        return (wrist['x'], wrist['y'])
+        return hand_data['keypoints'][0, :2]
     
-    def get_finger_tips(self, hand_data) -> Optional[Dict[str, Tuple[float, float]]]:
+    def get_finger_tips(self, hand_data) -> Optional[np.ndarray]:
         """Get positions of finger tips.
         
         Args:
             hand_data: Hand detection result
             
         Returns:
-            Dictionary with finger tip positions
+            (5, 2) array of (x, y) for thumb, index, middle, ring, pinky
         """
         if hand_data is None:
             return None
         
-        kp = hand_data['keypoints']
-        return {
-            'thumb': (kp[4]['x'], kp[4]['y']),
-            'index': (kp[8]['x'], kp[8]['y']),
-            'middle': (kp[12]['x'], kp[12]['y']),
-            'ring': (kp[16]['x'], kp[16]['y']),
-            'pinky': (kp[20]['x'], kp[20]['y'])
-        }
+        return hand_data['keypoints'][FINGERTIP_IDX, :2]
     
     def release(self):
         """Release MediaPipe resources."""
@@ -0,0 +1,9 @@
+"""MediaPipe hand landmark indices shared by the vision modules."""
+
+import numpy as np
+
+# Landmark indices of the five finger tips (thumb, index, middle, ring, pinky)
+FINGERTIP_IDX = np.array([4, 8, 12, 16, 20])
+
+# Middle finger base (landmark 9) followed by the finger tips
+WRIST_OFFSET_IDX = np.concatenate(([9], FINGERTIP_IDX))
@@ -1,7 +1,9 @@
 """Map hand pose to arm joint angles."""
 
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from .landmarks import WRIST_OFFSET_IDX
 
 class PoseMapper:
     """Maps hand gesture/pose to prosthetic arm servo angles."""
@@ -23,6 +25,21 @@ class PoseMapper:
             'wrist': (0, 180),       # Rotation
             'hand': (0, 180)         # Open (0) to Closed (180)
         }
+        
+        self._recompute_transforms()
+    
+    def _recompute_transforms(self):
+        """Cache bounds and scale factors used by the per-frame mappings."""
+        self._xL = self.screen_bounds['left']
+        self._xR = self.screen_bounds['right']
+        self._yT = self.screen_bounds['top']
+        self._yB = self.screen_bounds['bottom']
+        
+        self._shoulder_min, shoulder_max = self.servo_ranges['shoulder']
+        self._elbow_min, elbow_max = self.servo_ranges['elbow']
+        
+        self._x_scale = (shoulder_max - self._shoulder_min) / (self._xR - self._xL)
+        self._y_scale = (elbow_max - self._elbow_min) / (self._yB - self._yT)
     
     def hand_position_to_arm(self, hand_center: tuple, hand_data: Dict) -> Dict[str, float]:
         """Convert hand position to arm joint angles.
@@ -45,11 +62,8 @@ class PoseMapper:
         # Map hand Y position to elbow angle (vertical)
         elbow_angle = self._map_y_to_elbow(y)
         
-        # Map hand rotation to wrist angle
-        wrist_angle = self._calculate_hand_rotation(hand_data)
-        
-        # Map hand openness (finger spread) to gripper
-        hand_angle = self._calculate_hand_openness(hand_data)
+        # Map hand rotation to wrist angle and finger spread to gripper
+        wrist_angle, hand_angle = self._compute_rotation_and_openness(hand_data['keypoints'])
         
         return {
             'shoulder': shoulder_angle,
@@ -63,80 +77,42 @@ class PoseMapper:
         
         Left side (x=0) -> 45°, Right side (x=1) -> 135°
         """
-        # Clamp to screen bounds
-        x = max(self.screen_bounds['left'], min(self.screen_bounds['right'], x))
-        
-        # Normalize to [0, 1] within bounds
-        normalized = (x - self.screen_bounds['left']) / (self.screen_bounds['right'] - self.screen_bounds['left'])
-        
-        # Map to servo range
-        min_angle, max_angle = self.servo_ranges['shoulder']
-        return min_angle + normalized * (max_angle - min_angle)
+        # Clamp to screen bounds, then map to servo range
+        x_c = self._xL if x < self._xL else (self._xR if x > self._xR else x)
+        return self._shoulder_min + (x_c - self._xL) * self._x_scale
     
     def _map_y_to_elbow(self, y: float) -> float:
         """Map hand Y position to elbow angle.
         
         Top (y=0) -> 30° (extended), Bottom (y=1) -> 150° (bent)
         """
-        # Clamp to screen bounds
-        y = max(self.screen_bounds['top'], min(self.screen_bounds['bottom'], y))
-        
-        # Normalize to [0, 1] within bounds
-        normalized = (y - self.screen_bounds['top']) / (self.screen_bounds['bottom'] - self.screen_bounds['top'])
-        
-        # Map to servo range (inverted: top = less bent)
-        min_angle, max_angle = self.servo_ranges['elbow']
-        return min_angle + normalized * (max_angle - min_angle)
+        # Clamp to screen bounds, then map to servo range (inverted: top = less bent)
+        y_c = self._yT if y < self._yT else (self._yB if y > self._yB else y)
+        return self._elbow_min + (y_c - self._yT) * self._y_scale
     
-    def _calculate_hand_rotation(self, hand_data: Dict) -> float:
-        """Estimate hand rotation angle from keypoints.
+    def _compute_rotation_and_openness(self, kp: np.ndarray) -> Tuple[float, float]:
+        """Estimate wrist rotation and hand openness in one pass.
         
-        Uses palm and wrist to estimate rotation.
-        """
-        kp = hand_data['keypoints']
+        Rotation uses the wrist -> middle finger base direction. Openness
+        (0=open, 180=closed) uses the average wrist -> finger tip distance.
         
-        # Calculate angle between wrist and middle finger
-        wrist = np.array([kp[0]['x'], kp[0]['y']])
-        middle = np.array([kp[9]['x'], kp[9]['y']])
-        
-        diff = middle - wrist
-        angle_rad = np.arctan2(diff[1], diff[0])
-        angle_deg = np.degrees(angle_rad)
-        
-        # Normalize to [0, 180]
-        angle_deg = (angle_deg + 90) % 180
-        
-        return float(angle_deg)
-    
-    def _calculate_hand_openness(self, hand_data: Dict) -> float:
-        """Estimate hand openness (0=open, 180=closed).
-        
-        Uses distance between fingers to estimate grip.
+        Returns:
+            (wrist_angle, hand_angle) in degrees
         """
-        kp = hand_data['keypoints']
-        
-        # Get finger tips
-        finger_tips = np.array([
-            [kp[4]['x'], kp[4]['y']],   # Thumb
-            [kp[8]['x'], kp[8]['y']],   # Index
-            [kp[12]['x'], kp[12]['y']], # Middle
-            [kp[16]['x'], kp[16]['y']], # Ring
-            [kp[20]['x'], kp[20]['y']]  # Pinky
-        ])
-        
-        # Wrist position
-        wrist = np.array([kp[0]['x'], kp[0]['y']])
+        # Offsets from the wrist to the middle finger base and all finger tips
+        offsets = kp[WRIST_OFFSET_IDX, :2] - kp[0, :2]
         
-        # Average distance from wrist to finger tips
-        distances = np.linalg.norm(finger_tips - wrist, axis=1)
-        avg_distance = np.mean(distances)
+        # Calculate angle between wrist and middle finger, normalized to [0, 180]
+        diff = offsets[0]
+        wrist_angle = (np.degrees(np.arctan2(diff[1], diff[0])) + 90) % 180
         
         # Threshold: if fingers far from wrist, hand is open (0°)
         # If fingers close to wrist, hand is closed (180°)
         # Typical range: 0.05 (closed) to 0.3 (open)
-        openness = 1.0 - np.clip(avg_distance / 0.4, 0, 1)  # 0 = open, 1 = closed
+        avg_distance = np.linalg.norm(offsets[1:], axis=1).mean()
+        openness = 1.0 - min(avg_distance / 0.4, 1.0)  # 0 = open, 1 = closed
         
-        return float(openness * 180.0)
+        return float(wrist_angle), float(openness * 180.0)
     
     def set_screen_bounds(self, left: float, right: float, top: float, bottom: float):
         """Set active screen bounds for mapping (normalized 0-1)."""
@@ -146,3 +122,4 @@ class PoseMapper:
             'top': top,
             'bottom': bottom
         }
+        self._recompute_transforms()